@@ -0,0 +1,129 @@
+import argparse
+import json
+import os
+import random
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+import build
+
+current_dir = os.path.dirname(os.path.abspath(__file__))
+bench_dir = os.path.join(current_dir, "build", "bench")
+cold_samples_path = os.path.join(bench_dir, "cold_samples.json")
+
+# (label, mode, trim, optimize)
+VARIANTS = [
+    ("onefile", "onefile", False, 0),
+    ("onefile-trimmed", "onefile", True, 0),
+    ("onedir", "onedir", False, 0),
+    ("onedir-trimmed-O2", "onedir", True, 2),
+]
+
+
+def exe_path(label, mode):
+    exe_name = "HydrationReminder.exe" if os.name == "nt" else "HydrationReminder"
+    dist = os.path.join(bench_dir, label, "dist")
+    if mode == "onedir":
+        return os.path.join(dist, "HydrationReminder", exe_name)
+    return os.path.join(dist, exe_name)
+
+
+def time_launch(path):
+    # The probe env var makes the app close itself once the main loop is idle,
+    # so the wall time covers unpacking, imports and building the UI.
+    # APPDATA points at a scratch dir so the user's todos and settings are never touched.
+    with tempfile.TemporaryDirectory() as appdata:
+        env = dict(os.environ, HYDRATION_REMINDER_STARTUP_PROBE="1", APPDATA=appdata)
+        start = time.perf_counter()
+        subprocess.run([path], env=env, check=True, timeout=120)
+        return time.perf_counter() - start
+
+
+def bundle_size(path, mode):
+    root = os.path.dirname(path) if mode == "onedir" else path
+    if os.path.isfile(root):
+        return os.path.getsize(root)
+    total = 0
+    for dirpath, _, filenames in os.walk(root):
+        for filename in filenames:
+            total += os.path.getsize(os.path.join(dirpath, filename))
+    return total
+
+
+def load_cold_samples():
+    try:
+        with open(cold_samples_path, "r") as f:
+            return json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return {}
+
+
+def save_cold_samples(samples):
+    os.makedirs(bench_dir, exist_ok=True)
+    with open(cold_samples_path, "w") as f:
+        json.dump(samples, f)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare cold/warm startup of the packaged build variants")
+    parser.add_argument("--runs", type=int, default=5, help="warm launches per variant")
+    parser.add_argument("--skip-build", action="store_true", help="reuse executables from a previous run")
+    parser.add_argument("--cold", action="store_true",
+                        help="record one cold launch per variant; flush the OS file cache first "
+                             "(reboot, or empty the standby list with RAMMap on Windows)")
+    options = parser.parse_args()
+
+    cold_samples = load_cold_samples()
+    if options.cold:
+        # A freshly built exe sits in the page cache, so cold runs only make
+        # sense against existing builds after the cache has been flushed.
+        # Each invocation adds one sample per variant; repeat to collect more.
+        # The first launch also faults in shared system DLLs and AV state, so
+        # shuffle the order to spread that cost across variants.
+        order = list(VARIANTS)
+        random.shuffle(order)
+        for label, mode, _, _ in order:
+            cold_samples.setdefault(label, []).append(time_launch(exe_path(label, mode)))
+        save_cold_samples(cold_samples)
+
+    results = []
+    for label, mode, trim, optimize in VARIANTS:
+        path = exe_path(label, mode)
+        if not options.cold:
+            if not options.skip_build:
+                variant_dir = os.path.join(bench_dir, label)
+                build.build(
+                    mode=mode,
+                    trim=trim,
+                    optimize=optimize,
+                    distpath=os.path.join(variant_dir, "dist"),
+                    workpath=os.path.join(variant_dir, "work"),
+                    specpath=variant_dir,
+                )
+                # Cold samples taken against the previous build no longer apply
+                if cold_samples.pop(label, None) is not None:
+                    save_cold_samples(cold_samples)
+            # Discard one launch so first-run effects (e.g. AV scan) don't skew warm timings
+            time_launch(path)
+            warm = [time_launch(path) for _ in range(options.runs)]
+            warm_median, warm_min = statistics.median(warm), min(warm)
+        else:
+            warm_median = warm_min = None
+        cold = cold_samples.get(label, [])
+        cold_median = statistics.median(cold) if cold else None
+        results.append((label, cold_median, len(cold), warm_median, warm_min, bundle_size(path, mode)))
+
+    def fmt(value, width):
+        return f"{value:>{width}.2f}" if value is not None else f"{'-':>{width}}"
+
+    print(f"{'variant':<20}{'cold med (s)':>14}{'n':>4}{'warm med (s)':>14}{'warm min (s)':>14}{'size (MB)':>11}")
+    for label, cold_median, cold_count, warm_median, warm_min, size in results:
+        print(f"{label:<20}{fmt(cold_median, 14)}{cold_count:>4}{fmt(warm_median, 14)}"
+              f"{fmt(warm_min, 14)}{size / 1_048_576:>11.1f}")
+
+
+if __name__ == "__main__":
+    sys.exit(main())
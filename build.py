@@ -1,4 +1,5 @@
 import PyInstaller.__main__
+import argparse
 import os
 
 # Get the current directory
@@ -10,31 +11,119 @@ main_script = os.path.join(current_dir, "hydration_reminder.py")
 # Define the path to the assets directory
 assets_dir = os.path.join(current_dir, "assets")
 
-# Create the assets directory if it doesn't exist
-os.makedirs(assets_dir, exist_ok=True)
-
-# Define PyInstaller arguments (icon argument removed)
-pyinstaller_args = [
-    main_script,
-    "--onefile",
-    "--windowed",
-    "--name=HydrationReminder",
-    "--add-data=assets;assets",
-    "--hidden-import=customtkinter",
-    "--hidden-import=PIL",
-    "--hidden-import=plyer",
-    "--hidden-import=tkcalendar",
-    "--hidden-import=pystray",
-    "--hidden-import=json",
-    "--hidden-import=threading",
-    "--hidden-import=datetime",
-    "--hidden-import=time",
-    "--hidden-import=os",
-    "--hidden-import=tkinter",
-    "--hidden-import=ttk",
-    "--clean",
-    "--noconfirm"
+# Only third-party packages need to be listed; stdlib modules are found by analysis
+HIDDEN_IMPORTS = [
+    "customtkinter",
+    "PIL",
+    "plyer",
+    "tkcalendar",
+    "pystray",
 ]
 
-# Run PyInstaller
-PyInstaller.__main__.run(pyinstaller_args) 
\ No newline at end of file
+# Stdlib modules that only reach the bundle through importers the app never
+# runs on Windows (importers per build/HydrationReminder/xref-HydrationReminder.html).
+# None of them is imported by customtkinter, tkcalendar/babel, pystray or plyer's
+# win backend; platform still needs socket, pystray needs queue, babel needs decimal.
+EXCLUDED_MODULES = [
+    # typing_extensions (only inside its deprecated() decorator); drops _asyncio/_overlapped
+    "asyncio",
+    # only asyncio and the multiprocessing runtime hook pull these in
+    "concurrent",
+    "multiprocessing",
+    # urllib.request via http.cookiejar and xml.sax.saxutils; xml.sax itself is unused
+    "xml.sax",
+    "urllib.request",
+    "http",
+    "ftplib",
+    "netrc",
+    "xmlrpc",
+    # asyncio, ftplib, http.client, urllib.request; drops _ssl, libssl and libcrypto
+    "ssl",
+    # http.client, urllib.request and importlib.metadata (never queried at runtime)
+    "email",
+    "importlib.metadata",
+    "csv",
+    # shutil/zipfile archive helpers only, imported lazily or optionally
+    "tarfile",
+    "bz2",
+    "lzma",
+    # Pillow extras reached only from Image methods the app never calls
+    "PIL.ImageQt",
+    "PIL.ImageCms",
+    "PIL.ImageShow",
+    "PIL.ImageMath",
+    "PIL.PdfParser",
+]
+
+# Image plugins kept in the bundle: the icon is an .ico, which embeds PNG/BMP frames
+KEPT_PIL_PLUGINS = {"IcoImagePlugin", "PngImagePlugin", "BmpImagePlugin"}
+
+PIL_PLUGINS = [
+    "AvifImagePlugin", "BlpImagePlugin", "BmpImagePlugin", "BufrStubImagePlugin",
+    "CurImagePlugin", "DcxImagePlugin", "DdsImagePlugin", "EpsImagePlugin",
+    "FitsImagePlugin", "FliImagePlugin", "FpxImagePlugin", "FtexImagePlugin",
+    "GbrImagePlugin", "GifImagePlugin", "GribStubImagePlugin", "Hdf5StubImagePlugin",
+    "IcnsImagePlugin", "IcoImagePlugin", "ImImagePlugin", "ImtImagePlugin",
+    "IptcImagePlugin", "Jpeg2KImagePlugin", "JpegImagePlugin", "McIdasImagePlugin",
+    "MicImagePlugin", "MpegImagePlugin", "MpoImagePlugin", "MspImagePlugin",
+    "PalmImagePlugin", "PcdImagePlugin", "PcxImagePlugin", "PdfImagePlugin",
+    "PixarImagePlugin", "PngImagePlugin", "PpmImagePlugin", "PsdImagePlugin",
+    "QoiImagePlugin", "SgiImagePlugin", "SpiderImagePlugin", "SunImagePlugin",
+    "TgaImagePlugin", "TiffImagePlugin", "WebPImagePlugin", "WmfImagePlugin",
+    "XVThumbImagePlugin", "XbmImagePlugin", "XpmImagePlugin",
+]
+
+
+def pyinstaller_args(mode="onefile", trim=True, optimize=0, name="HydrationReminder",
+                     distpath=None, workpath=None, specpath=None):
+    """Build the PyInstaller argument list for one build variant.
+
+    mode is "onefile" or "onedir". onedir skips unpacking the runtime to a
+    temp dir on every launch, which is what dominates onefile startup.
+    """
+    args = [
+        main_script,
+        f"--{mode}",
+        "--windowed",
+        f"--name={name}",
+        f"--add-data={assets_dir}{os.pathsep}assets",
+        "--clean",
+        "--noconfirm",
+    ]
+    args += [f"--hidden-import={module}" for module in HIDDEN_IMPORTS]
+    if trim:
+        excluded = EXCLUDED_MODULES + [
+            f"PIL.{plugin}" for plugin in PIL_PLUGINS if plugin not in KEPT_PIL_PLUGINS
+        ]
+        args += [f"--exclude-module={module}" for module in excluded]
+    if optimize:
+        # Bytecode is precompiled at this level (asserts/docstrings stripped)
+        args.append(f"--optimize={optimize}")
+    if distpath:
+        args.append(f"--distpath={distpath}")
+    if workpath:
+        args.append(f"--workpath={workpath}")
+    if specpath:
+        args.append(f"--specpath={specpath}")
+    return args
+
+
+def build(mode="onefile", trim=True, optimize=0, name="HydrationReminder",
+          distpath=None, workpath=None, specpath=None):
+    # Create the assets directory if it doesn't exist
+    os.makedirs(assets_dir, exist_ok=True)
+    PyInstaller.__main__.run(pyinstaller_args(mode, trim, optimize, name, distpath, workpath, specpath))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Package Health & Task Reminder with PyInstaller")
+    parser.add_argument("--mode", choices=["onefile", "onedir"], default="onefile",
+                        help="onedir starts faster; onefile ships a single exe")
+    parser.add_argument("--no-trim", action="store_true",
+                        help="keep unused stdlib modules and PIL plugins in the bundle")
+    parser.add_argument("--optimize", type=int, choices=[0, 1, 2], default=0,
+                        help="bytecode optimization level for bundled modules")
+    options = parser.parse_args()
+
+    # Run PyInstaller
+    build(mode=options.mode, trim=not options.no_trim, optimize=options.optimize)
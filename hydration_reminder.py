@@ -7,7 +7,9 @@ from PIL import Image, ImageTk
 import os
 from datetime import datetime, timedelta
 import json
+import uuid
 from tkcalendar import Calendar
+from calendar import monthrange
 from tkinter import ttk
 import pystray
 from PIL import Image, ImageDraw
@@ -19,6 +21,16 @@ try:
 except Exception:
     _winreg = None
 
+# Snooze choices offered on reminder popups, in minutes (first is used on auto-close)
+SNOOZE_MINUTES = (5, 15, 60)
+# Unanswered popups are auto-snoozed at most this many times in a row
+MAX_AUTO_SNOOZES = 3
+# Longest delay handed to a single Tk after() call (one day, in ms)
+MAX_AFTER_MS = 24 * 60 * 60 * 1000
+
+# Set by bench_startup.py: close as soon as the UI is up and skip the startup registration
+STARTUP_PROBE = os.getenv("HYDRATION_REMINDER_STARTUP_PROBE") == "1"
+
 def get_resource_path(relative_path: str) -> str:
     try:
         base_path = sys._MEIPASS  # type: ignore[attr-defined]
@@ -75,13 +87,19 @@ class ReminderApp:
         self.hydration_thread = None
         self.eye_thread = None
         self.todos = []
+        # Pending todos bucketed by due date ("YYYY-MM-DD" -> [todo, ...])
+        self.due_index = {}
+        self.agenda_window = None
+        # Deferred reminders waiting to fire again
+        self.snoozes = []
         
         # Load todos from file if exists
         self.load_todos()
         
         self.setup_ui()
         self.setup_tray()
-        self.register_startup(enable=True)
+        if not STARTUP_PROBE:
+            self.register_startup(enable=True)
         
         # Start reminders automatically (only via unified countdown popup)
         # Disable background threads to avoid duplicate notifications
@@ -99,6 +117,10 @@ class ReminderApp:
         )
         self.timer_label.pack(pady=10)
         self.update_countdown_timer()
+        
+        # Restore snoozed reminders once the main loop is running
+        self.load_snoozes()
+        self.window.after(1000, self.restore_snoozes)
     
     def setup_tray(self):
         # Load icon from file or fallback
@@ -243,6 +265,15 @@ class ReminderApp:
         )
         self.time_label.pack(side="left", padx=5, pady=5)
         
+        # Agenda Button
+        agenda_button = ctk.CTkButton(
+            label_frame,
+            text="Agenda",
+            command=self.show_agenda,
+            width=100
+        )
+        agenda_button.pack(side="right", padx=5, pady=5)
+        
         # Todo List Frame
         self.todo_frame = ctk.CTkScrollableFrame(self.window)
         self.todo_frame.pack(pady=10, padx=20, fill="both", expand=True)
@@ -381,6 +412,66 @@ class ReminderApp:
         self.time_picker_open = False
         window.destroy()
     
+    def show_agenda(self):
+        if self.agenda_window is not None:
+            self.agenda_window.lift()
+            return
+        # Create a new top-level window
+        agenda_window = tk.Toplevel(self.window)
+        agenda_window.title("Agenda")
+        agenda_window.geometry("360x520")
+        agenda_window.protocol("WM_DELETE_WINDOW", self._on_close_agenda)
+        self.agenda_window = agenda_window
+        # Calendar with due days highlighted
+        self.agenda_calendar = Calendar(agenda_window, selectmode='day', date_pattern='yyyy-mm-dd')
+        self.agenda_calendar.tag_config("due", background="#1f6aa5", foreground="white")
+        self.agenda_calendar.pack(pady=20, padx=20)
+        self.agenda_calendar.bind("<<CalendarMonthChanged>>", lambda event: self.refresh_agenda())
+        self.agenda_calendar.bind("<<CalendarSelected>>", lambda event: self.refresh_agenda())
+        # Todos due on the selected day
+        self.agenda_list_frame = ctk.CTkScrollableFrame(agenda_window)
+        self.agenda_list_frame.pack(pady=10, padx=20, fill="both", expand=True)
+        self.refresh_agenda()
+    
+    def refresh_agenda(self):
+        if self.agenda_window is None:
+            return
+        cal = self.agenda_calendar
+        # Mark days of the displayed month that have pending todos
+        cal.calevent_remove('all')
+        month, year = cal.get_displayed_month()
+        for date, todos in self.todos_due_in_month(year, month).items():
+            day = datetime.strptime(date, "%Y-%m-%d").date()
+            for todo in todos:
+                cal.calevent_create(day, todo["task"], tags="due")
+        # List the selected day's todos
+        for widget in self.agenda_list_frame.winfo_children():
+            widget.destroy()
+        selected = cal.get_date()
+        todos = sorted(self.due_index.get(selected, []), key=lambda t: t.get("time") or "")
+        if not todos:
+            empty_label = ctk.CTkLabel(
+                self.agenda_list_frame,
+                text=f"Nothing due on {selected}",
+                font=("Helvetica", 12)
+            )
+            empty_label.pack(pady=5)
+        for todo in todos:
+            task_text = todo["task"]
+            if todo.get("time"):
+                task_text = f"{todo['time']}  {task_text}"
+            task_label = ctk.CTkLabel(
+                self.agenda_list_frame,
+                text=task_text,
+                font=("Helvetica", 12)
+            )
+            task_label.pack(anchor="w", padx=5, pady=2)
+    
+    def _on_close_agenda(self):
+        window = self.agenda_window
+        self.agenda_window = None
+        window.destroy()
+    
     def add_todo(self):
         task = self.task_entry.get()
         
@@ -392,6 +483,7 @@ class ReminderApp:
             return
         
         todo = {
+            "id": uuid.uuid4().hex,
             "task": task,
             "date": self.selected_date,
             "time": self.selected_time,
@@ -400,8 +492,10 @@ class ReminderApp:
         }
         
         self.todos.append(todo)
+        self.index_todo(todo)
         self.save_todos()
         self.refresh_todo_list()
+        self.refresh_agenda()
         
         # Clear entries
         self.task_entry.delete(0, tk.END)
@@ -473,8 +567,10 @@ class ReminderApp:
     
     def complete_todo(self, index):
         self.todos[index]["completed"] = True
+        self.unindex_todo(self.todos[index])
         self.save_todos()
         self.refresh_todo_list()
+        self.refresh_agenda()
 
     def toggle_daily(self, index, value):
         self.todos[index]["daily"] = bool(value)
@@ -486,9 +582,11 @@ class ReminderApp:
             pass
     
     def delete_todo(self, index):
+        self.unindex_todo(self.todos[index])
         del self.todos[index]
         self.save_todos()
         self.refresh_todo_list()
+        self.refresh_agenda()
     
     def save_todos(self):
         try:
@@ -505,6 +603,46 @@ class ReminderApp:
                 self.todos = json.load(f)
         except FileNotFoundError:
             self.todos = []
+        # Todos saved before ids existed get one so snoozes can refer to them
+        missing_ids = [todo for todo in self.todos if not todo.get("id")]
+        for todo in missing_ids:
+            todo["id"] = uuid.uuid4().hex
+        if missing_ids:
+            self.save_todos()
+        self.rebuild_due_index()
+    
+    # -------- Due-date index --------
+    def rebuild_due_index(self):
+        self.due_index = {}
+        for todo in self.todos:
+            self.index_todo(todo)
+    
+    def index_todo(self, todo):
+        if todo.get("completed") or not todo.get("date"):
+            return
+        self.due_index.setdefault(todo["date"], []).append(todo)
+    
+    def unindex_todo(self, todo):
+        date = todo.get("date")
+        bucket = self.due_index.get(date)
+        if not bucket:
+            return
+        # Match by identity: two todos may hold identical values
+        for i, entry in enumerate(bucket):
+            if entry is todo:
+                del bucket[i]
+                break
+        if not bucket:
+            del self.due_index[date]
+    
+    def todos_due_in_month(self, year, month):
+        # Touch only this month's buckets, never the full todo list
+        due = {}
+        for day in range(1, monthrange(year, month)[1] + 1):
+            date = f"{year:04d}-{month:02d}-{day:02d}"
+            if date in self.due_index:
+                due[date] = self.due_index[date]
+        return due
     
     def schedule_todo_notification(self, todo):
         if todo["date"] and todo["time"]:
@@ -519,33 +657,125 @@ class ReminderApp:
                     else:
                         return
 
-                delay = (reminder_time - now).total_seconds()
                 def notify_and_reschedule():
+                    # Deleted or completed todos keep their timer; drop them here
+                    if todo.get("completed") or not any(entry is todo for entry in self.todos):
+                        return
                     self.show_todo_notification(todo)
                     if todo.get("daily"):
                         # reschedule for next day
                         try:
                             todo_date = datetime.strptime(todo['date'], "%Y-%m-%d").date()
                             next_day = (datetime.combine(todo_date, datetime.min.time()) + timedelta(days=1)).date()
+                            self.unindex_todo(todo)
                             todo['date'] = next_day.strftime("%Y-%m-%d")
+                            self.index_todo(todo)
                             self.save_todos()
+                            self.refresh_agenda()
                         except Exception:
                             pass
                         self.schedule_todo_notification(todo)
-                threading.Timer(delay, notify_and_reschedule).start()
+                self.schedule_at(reminder_time, notify_and_reschedule)
             except ValueError:
                 pass
     
+    def schedule_at(self, when, callback):
+        # Shared due-time scheduler for todos and snoozed reminders. Callers
+        # run on the Tk thread, so the callback runs there too
+        delay_ms = max(0, int((when - datetime.now()).total_seconds() * 1000))
+        if delay_ms > MAX_AFTER_MS:
+            # Tk rejects delays past a 32-bit millisecond count; check back later
+            self.window.after(MAX_AFTER_MS, lambda: self.schedule_at(when, callback))
+            return
+        self.window.after(delay_ms, callback)
+    
+    # -------- Snooze queue --------
+    def snooze(self, kind, minutes, todo=None, auto_snoozes=0):
+        due = datetime.now() + timedelta(minutes=minutes)
+        entry = {"kind": kind, "due": due.strftime("%Y-%m-%d %H:%M:%S"), "auto_snoozes": auto_snoozes}
+        if kind == "health":
+            # Only one health reminder is ever deferred; a newer one replaces it
+            self.snoozes = [pending for pending in self.snoozes if pending.get("kind") != "health"]
+        elif todo is not None:
+            entry["todo_id"] = todo.get("id")
+        self.snoozes.append(entry)
+        self.save_snoozes()
+        self.schedule_snooze(entry)
+    
+    def schedule_snooze(self, entry):
+        try:
+            due = datetime.strptime(entry["due"], "%Y-%m-%d %H:%M:%S")
+        except (KeyError, ValueError):
+            return
+        self.schedule_at(due, lambda: self.fire_snooze(entry))
+    
+    def fire_snooze(self, entry):
+        for i, pending in enumerate(self.snoozes):
+            if pending is entry:
+                del self.snoozes[i]
+                break
+        else:
+            # Replaced by a newer snooze
+            return
+        self.save_snoozes()
+        auto_snoozes = entry.get("auto_snoozes", 0)
+        if entry.get("kind") == "todo":
+            # Skip todos completed or deleted while snoozed
+            todo = self.find_pending_todo(entry.get("todo_id"))
+            if todo is not None:
+                self.show_unified_todo_popup(todo, auto_snoozes)
+        else:
+            self.show_unified_reminder_popup(auto_snoozes)
+    
+    def find_pending_todo(self, todo_id):
+        if not todo_id:
+            return None
+        for todo in self.todos:
+            if todo.get("id") == todo_id and not todo.get("completed"):
+                return todo
+        return None
+    
+    def restore_snoozes(self):
+        # One timer per pending snooze; todos are not rescanned
+        for entry in list(self.snoozes):
+            self.schedule_snooze(entry)
+    
+    def save_snoozes(self):
+        try:
+            snoozes_path = os.path.join(get_app_data_dir(), "snoozes.json")
+            # Write a temp file and swap it in so a crash never truncates the queue
+            temp_path = snoozes_path + ".tmp"
+            with open(temp_path, "w") as f:
+                json.dump(self.snoozes, f)
+            os.replace(temp_path, snoozes_path)
+        except Exception:
+            pass
+    
+    def load_snoozes(self):
+        try:
+            snoozes_path = os.path.join(get_app_data_dir(), "snoozes.json")
+            with open(snoozes_path, "r") as f:
+                snoozes = json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            snoozes = []
+        if not isinstance(snoozes, list):
+            snoozes = []
+        # Keep only well-formed entries so restore_snoozes cannot trip over them
+        self.snoozes = [
+            entry for entry in snoozes
+            if isinstance(entry, dict) and isinstance(entry.get("due"), str)
+        ]
+    
     def show_todo_notification(self, todo):
         # Use unified, top-most popup similar to health reminder
         self.show_unified_todo_popup(todo)
 
-    def show_unified_todo_popup(self, todo):
+    def show_unified_todo_popup(self, todo, auto_snoozes=0):
         try:
             popup = tk.Toplevel(self.window)
             popup.title("Todo Reminder")
             popup.attributes("-topmost", True)
-            popup.geometry("460x240")
+            popup.geometry("460x280")
             try:
                 popup.iconbitmap(get_resource_path("icon.ico"))
             except Exception:
@@ -569,7 +799,9 @@ class ReminderApp:
             label.pack(pady=20)
             btn = ctk.CTkButton(frame, text="OK", command=lambda: self._close_unified_popup(popup), width=120)
             btn.pack(pady=10)
-            popup.after(60_000, lambda: self._close_unified_popup(popup))
+            self._add_snooze_buttons(frame, popup, "todo", todo)
+            # Snooze instead of dropping the reminder if not acknowledged
+            popup.after(60_000, lambda: self._auto_snooze_popup(popup, "todo", todo, auto_snoozes))
             popup.after(200, lambda: popup.attributes("-topmost", True))
         except Exception:
             pass
@@ -594,12 +826,12 @@ class ReminderApp:
         # Deprecated in favor of show_unified_reminder_popup
         self.show_unified_reminder_popup()
 
-    def show_unified_reminder_popup(self):
+    def show_unified_reminder_popup(self, auto_snoozes=0):
         try:
             popup = tk.Toplevel(self.window)
             popup.title("Health Reminder")
             popup.attributes("-topmost", True)
-            popup.geometry("420x220")
+            popup.geometry("420x260")
             try:
                 popup.iconbitmap(get_resource_path("icon.ico"))
             except Exception:
@@ -618,8 +850,9 @@ class ReminderApp:
             label.pack(pady=20)
             btn = ctk.CTkButton(frame, text="OK", command=lambda: self._close_unified_popup(popup), width=120)
             btn.pack(pady=10)
-            # Auto-close after 60 seconds if not acknowledged
-            popup.after(60_000, lambda: self._close_unified_popup(popup))
+            self._add_snooze_buttons(frame, popup, "health")
+            # Auto-close after 60 seconds if not acknowledged, snoozing the reminder
+            popup.after(60_000, lambda: self._auto_snooze_popup(popup, "health", None, auto_snoozes))
             # Force on top again shortly after creation
             popup.after(200, lambda: popup.attributes("-topmost", True))
         except Exception:
@@ -632,6 +865,33 @@ class ReminderApp:
                 popup.destroy()
         except Exception:
             pass
+
+    def _add_snooze_buttons(self, frame, popup: tk.Toplevel, kind: str, todo=None):
+        snooze_frame = ctk.CTkFrame(frame, fg_color="transparent")
+        snooze_frame.pack(pady=5)
+        for minutes in SNOOZE_MINUTES:
+            snooze_button = ctk.CTkButton(
+                snooze_frame,
+                text=f"Snooze {minutes} min",
+                command=lambda m=minutes: self._snooze_popup(popup, kind, m, todo),
+                width=110
+            )
+            snooze_button.pack(side="left", padx=5)
+
+    def _snooze_popup(self, popup: tk.Toplevel, kind: str, minutes: int, todo=None, auto_snoozes=0):
+        self._close_unified_popup(popup)
+        self.snooze(kind, minutes, todo, auto_snoozes)
+
+    def _auto_snooze_popup(self, popup: tk.Toplevel, kind: str, todo=None, auto_snoozes=0):
+        try:
+            if not popup.winfo_exists():
+                return
+        except Exception:
+            return
+        if auto_snoozes >= MAX_AUTO_SNOOZES:
+            self._close_unified_popup(popup)
+            return
+        self._snooze_popup(popup, kind, SNOOZE_MINUTES[0], todo, auto_snoozes + 1)
     
     def run(self):
         self.window.mainloop()
@@ -670,4 +930,10 @@ class ReminderApp:
 
 if __name__ == "__main__":
     app = ReminderApp()
+    if STARTUP_PROBE:
+        def end_probe():
+            # Remove the tray icon too, or every timed launch leaves one behind
+            app.icon.stop()
+            app.window.destroy()
+        app.window.after_idle(end_probe)
     app.run() 
\ No newline at end of file